@@ -19,7 +19,7 @@ Source du fichier arissnews.txt:
 
 Dépendances requises:
     - Python 3.9+
-    - python-dateutil : pour le parsing des dates
+    - python-dateutil : pour le parsing des dates hors format standard
     - tzdata : pour la gestion des fuseaux horaires
     - requests : pour le téléchargement de la newsletter
 
@@ -69,13 +69,31 @@ import re
 import os
 import sys
 import argparse
-import requests
-from datetime import datetime
-from dateutil import parser
-import locale
+import functools
+import mmap
+from datetime import datetime, timezone
 from zoneinfo import ZoneInfo
 
+_UTC = timezone.utc
+_PARIS = ZoneInfo('Europe/Paris')
+
+_CONTACT_DT_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+FR_MONTHS = ('', 'janvier', 'février', 'mars', 'avril', 'mai', 'juin', 'juillet',
+             'août', 'septembre', 'octobre', 'novembre', 'décembre')
+FR_WEEKDAYS = ('lundi', 'mardi', 'mercredi', 'jeudi', 'vendredi', 'samedi', 'dimanche')
+
+_SEP = "=" * 70
+# Question numérotée, éventuellement précédée de blancs
+_Q_RE = re.compile(r'\s*\d+\.')
+
 class ArissContact:
+    __slots__ = (
+        'school', 'location', 'callsign', 'frequency', 'astronaut',
+        'astronaut_callsign', 'date_time', 'questions', 'livestream',
+        'elevation', 'contact_type', 'mentor', 'station_location'
+    )
+
     def __init__(self):
         self.school = ""
         self.location = ""
@@ -91,155 +109,240 @@ class ArissContact:
         self.mentor = ""
         self.station_location = ""
 
+def _iter_sections(text):
+    """
+    Itère sur les sections de la newsletter sans construire la liste de
+    toutes les sections, qui doublerait la mémoire occupée par le texte.
+    """
+    pos = 0
+    end = len(text)
+    while pos < end:
+        cut = text.find(_SEP, pos)
+        if cut < 0:
+            cut = end
+        yield text[pos:cut]
+        pos = cut + len(_SEP)
+
+def _parse_contact_datetime(date_time_str):
+    """
+    Convertit la date d'un contact (ex: "Mon 2024-03-25 13:45:00") en datetime UTC.
+    
+    Le format habituel de la newsletter est lu directement ; dateutil n'est
+    utilisé qu'en repli pour les lignes qui s'en écartent.
+    """
+    try:
+        date_time = datetime.strptime(' '.join(date_time_str.split()[-2:]), _CONTACT_DT_FORMAT)
+    except ValueError:
+        from dateutil import parser
+        date_time = parser.parse(date_time_str)
+    return date_time.replace(tzinfo=_UTC)
+
+# Les gestionnaires reçoivent la ligne entière et la valeur qui suit le marqueur
+
+def _parse_station(contact, line, value, contact_type):
+    parts = line.split(',', 2)
+    contact.school = parts[0].strip()
+    
+    if len(parts) > 1:
+        contact.location = parts[1].strip()
+    
+    if len(parts) > 2:
+        contact.contact_type = contact_type
+        contact.callsign = value.strip()
+
+def _parse_telebridge(contact, line, value):
+    _parse_station(contact, line, value, "telebridge")
+    if contact.callsign.startswith('IK'):
+        contact.station_location = "italienne"
+
+def _parse_direct(contact, line, value):
+    _parse_station(contact, line, value, "direct")
+
+def _parse_frequency(contact, line, value):
+    _, sep, frequency = value.partition('be')
+    if sep:
+        contact.frequency = frequency.strip()
+
+def _parse_crewmember(contact, line, value):
+    crew_info = value.strip()
+    name, sep, callsign = crew_info.rpartition(' ')
+    if sep:
+        contact.astronaut = name
+        contact.astronaut_callsign = callsign
+    else:
+        contact.astronaut = crew_info
+
+def _parse_schedule(contact, line, value):
+    date_time_str, _, elevation_str = value.partition('UTC')
+    try:
+        contact.date_time = _parse_contact_datetime(date_time_str.strip())
+    except ValueError as e:
+        print(f"Error parsing date: {e}")
+        return
+    elevation_str = elevation_str.strip()
+    if elevation_str:
+        contact.elevation = elevation_str
+
+def _parse_livestream(contact, line, value):
+    contact.livestream = value.strip()
+
+def _parse_mentor(contact, line, value):
+    contact.mentor = value.strip()
+
+# Marqueurs (en minuscules) des lignes d'une section, testés dans l'ordre.
+# La détection se fait sur la ligne en minuscules ; le motif compilé ne sert
+# qu'à situer la fin du marqueur dans la ligne d'origine pour en lire la valeur.
+_FIELD_MARKERS = tuple(
+    (marker, re.compile(re.escape(marker), re.IGNORECASE), handler)
+    for marker, handler in (
+        (', telebridge via ', _parse_telebridge),
+        (', direct via ', _parse_direct),
+        ('frequency', _parse_frequency),
+        ('scheduled crewmember is', _parse_crewmember),
+        ('contact is go for:', _parse_schedule),
+        ('watch for the livestream at', _parse_livestream),
+        ('the ariss mentor is', _parse_mentor),
+    )
+)
+
+@functools.lru_cache(maxsize=256)
+def _format_day(year, month, day):
+    """Retourne la date au format JJ/MM/AAAA et la date en toutes lettres."""
+    weekday = datetime(year, month, day).weekday()
+    day_fr = f"{FR_WEEKDAYS[weekday]} {day:02d} {FR_MONTHS[month]} {year}"
+    return f"{day:02d}/{month:02d}/{year}", day_fr
+
+def _format_hm(hour, minute):
+    return f"{hour:02d}:{minute:02d}"
+
 class ArissArticleGenerator:
-    def __init__(self, text):
+    def __init__(self, text, target_date=None):
         self.raw_text = text
+        self.target_date = target_date
         self.contacts = []
-        try:
-            locale.setlocale(locale.LC_TIME, 'fr_FR.UTF-8')
-        except locale.Error:
-            try:
-                locale.setlocale(locale.LC_TIME, 'fr_FR')
-            except locale.Error:
-                print("Warning: French locale not available. Dates will be in English.")
         self.parse_contacts()
 
     def parse_contacts(self):
-        contact_sections = re.split(r'======================================================================', self.raw_text)
-        
-        for section in contact_sections:
+        target_date = self.target_date
+        for section in _iter_sections(self.raw_text):
             if not section.strip():
                 continue
                 
             contact = ArissContact()
-            lines = section.strip().split('\n')
-            
-            for line in lines:
-                if ', telebridge via ' in line or ', direct via ' in line:
-                    parts = line.split(',', 2)
-                    contact.school = parts[0].strip()
-                    
-                    if len(parts) > 1:
-                        contact.location = parts[1].strip()
-                    
-                    if len(parts) > 2:
-                        type_and_call = parts[2].strip()
-                        if 'telebridge via' in type_and_call:
-                            contact.contact_type = "telebridge"
-                            contact.callsign = type_and_call.split('via')[1].strip()
-                            if contact.callsign.startswith('IK'):
-                                contact.station_location = "italienne"
-                        elif 'direct via' in type_and_call:
-                            contact.contact_type = "direct"
-                            contact.callsign = type_and_call.split('via')[1].strip()
-                
-                elif 'frequency' in line.lower():
-                    try:
-                        contact.frequency = line.split('be')[1].strip()
-                    except IndexError:
-                        continue
-                
-                elif 'scheduled crewmember is' in line.lower():
-                    crew_info = line.split('is')[1].strip()
-                    if ' ' in crew_info:
-                        name_parts = crew_info.split(' ')
-                        contact.astronaut = ' '.join(name_parts[:-1])
-                        contact.astronaut_callsign = name_parts[-1]
-                    else:
-                        contact.astronaut = crew_info
-                
-                elif 'Contact is go for:' in line:
-                    try:
-                        date_time_str = line.split('Contact is go for:')[1].split('UTC')[0].strip()
-                        parsed_dt = parser.parse(date_time_str)
-                        contact.date_time = datetime(
-                            parsed_dt.year,
-                            parsed_dt.month,
-                            parsed_dt.day,
-                            parsed_dt.hour,
-                            parsed_dt.minute,
-                            parsed_dt.second,
-                            tzinfo=ZoneInfo('UTC')
-                        )
-                        elevation_str = line.split('UTC')[1].strip()
-                        if elevation_str:
-                            contact.elevation = elevation_str
-                    except (ValueError, IndexError) as e:
-                        print(f"Error parsing date: {e}")
-                
-                elif 'Watch for the Livestream at' in line:
-                    contact.livestream = line.split('at')[1].strip()
-                
-                elif 'The ARISS mentor is' in line:
-                    contact.mentor = line.split('is')[1].strip()
-            
-            # Extract questions
             questions_started = False
-            for line in lines:
-                if 'Proposed questions' in line:
+            
+            for line in section.strip().splitlines():
+                line_lower = line.lower()
+                if 'proposed questions' in line_lower:
                     questions_started = True
                     continue
-                if questions_started and line.strip() and not line.startswith('==='):
-                    if re.match(r'^\d+\.', line.strip()):
-                        contact.questions.append(line.strip())
+                
+                for marker, marker_re, handler in _FIELD_MARKERS:
+                    if marker in line_lower:
+                        found = marker_re.search(line)
+                        if found:
+                            handler(contact, line, line[found.end():])
+                        break
+                
+                # Extract questions
+                if questions_started and _Q_RE.match(line):
+                    contact.questions.append(line.strip())
             
-            if contact.school:
-                self.contacts.append(contact)
+            if not contact.school:
+                continue
+            # Une section peut être reprogrammée : seule la dernière date lue compte
+            if target_date and (not contact.date_time or contact.date_time.date() != target_date):
+                continue
+            self.contacts.append(contact)
 
     def generate_wordpress_article(self, contact):
-        paris_time = contact.date_time.astimezone(ZoneInfo('Europe/Paris'))
-        date_fr = paris_time.strftime("%d/%m/%Y")
-        time_utc = contact.date_time.strftime("%H:%M")
-        time_paris = paris_time.strftime("%H:%M")
+        paris_time = contact.date_time.astimezone(_PARIS)
+        date_fr, day_fr = _format_day(paris_time.year, paris_time.month, paris_time.day)
+        time_utc = _format_hm(contact.date_time.hour, contact.date_time.minute)
+        time_paris = _format_hm(paris_time.hour, paris_time.minute)
         
         title = f"Contact radioamateur du {date_fr} – {contact.callsign}"
         
-        content = f"""Un contact radioamateur est prévu le {paris_time.strftime('%A %d %B %Y').lower()} vers {time_utc} UTC ({time_paris} heure de Paris).
+        parts = [f"""Un contact radioamateur est prévu le {day_fr} vers {time_utc} UTC ({time_paris} heure de Paris).
 
-Il aura lieu entre l'astronaute {contact.astronaut} ({contact.astronaut_callsign}) et {contact.school} en {contact.location}."""
+Il aura lieu entre l'astronaute {contact.astronaut} ({contact.astronaut_callsign}) et {contact.school} en {contact.location}."""]
 
         if contact.contact_type.lower() == "telebridge":
             station_desc = f" la station {contact.station_location} " if contact.station_location else " la station "
-            content += f"\n\nLe contact sera sur {contact.frequency} (+/-3 KHz de doppler) en FM étroite. Il sera conduit par télébridge via{station_desc}{contact.callsign} et donc audible depuis la France."
+            parts.append(f"\n\nLe contact sera sur {contact.frequency} (+/-3 KHz de doppler) en FM étroite. Il sera conduit par télébridge via{station_desc}{contact.callsign} et donc audible depuis la France.")
         else:
-            content += f"\n\nLe contact sera sur {contact.frequency} (+/-3 KHz de doppler) en FM étroite. Il sera en direct via la station {contact.callsign} et donc audible depuis la France."
+            parts.append(f"\n\nLe contact sera sur {contact.frequency} (+/-3 KHz de doppler) en FM étroite. Il sera en direct via la station {contact.callsign} et donc audible depuis la France.")
 
         if contact.livestream:
-            content += f"\n\nUn livestream sera disponible sur : {contact.livestream}"
+            parts.append(f"\n\nUn livestream sera disponible sur : {contact.livestream}")
 
-        content += "\n\n<!-- more -->\n\nQuestions prévues :\n\n"
+        parts.append("\n\n<!-- more -->\n\nQuestions prévues :\n\n")
         
-        for question in contact.questions:
-            content += f"{question}\n"
+        parts.extend(f"{question}\n" for question in contact.questions)
             
-        content += "\nL'équipe ARISS se tient à votre disposition pour tout support relatif à l'écoute de ce contact.\n\n73 et bonne écoute"
+        parts.append("\nL'équipe ARISS se tient à votre disposition pour tout support relatif à l'écoute de ce contact.\n\n73 et bonne écoute")
         
         return {
             'title': title,
-            'content': content,
+            'content': "".join(parts),
             'category': 'Contact ARISS',
             'status': 'draft'
         }
 
-def download_newsletter(url):
+def download_newsletter(url, destination):
     """
-    Télécharge la newsletter depuis l'URL spécifiée.
+    Télécharge la newsletter depuis l'URL spécifiée et l'enregistre par blocs
+    dans le fichier de destination, sans la charger entièrement en mémoire.
     
     Args:
         url (str): URL de la newsletter
-    
-    Returns:
-        str: Contenu de la newsletter
+        destination (str): Chemin du fichier dans lequel sauvegarder la newsletter
         
     Raises:
         Exception: Si le téléchargement échoue
     """
+    import requests
+    
+    partial = destination + '.part'
     try:
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()  # Lève une exception si le statut n'est pas 200
-        return response.text
+        with requests.get(url, timeout=10, stream=True) as response:
+            response.raise_for_status()  # Lève une exception si le statut n'est pas 200
+            with open(partial, 'wb') as f:
+                for chunk in response.iter_content(chunk_size=65536):
+                    f.write(chunk)
+        # Ne remplace le fichier existant qu'une fois le téléchargement complet
+        os.replace(partial, destination)
     except requests.exceptions.RequestException as e:
         raise Exception(f"Erreur lors du téléchargement de la newsletter: {str(e)}")
+    finally:
+        # Quelle que soit l'erreur (réseau, disque plein, interruption), ne pas
+        # laisser de fichier partiel derrière soi
+        if os.path.exists(partial):
+            os.remove(partial)
+
+def read_newsletter(path):
+    """
+    Lit le fichier de la newsletter via un mmap.
+    
+    Le texte est décodé directement depuis les pages du fichier projetées en
+    mémoire, sans passer par une copie intermédiaire en octets : le seul
+    tampon alloué est la chaîne finale.
+    
+    Args:
+        path (str): Chemin vers le fichier arissnews.txt
+    
+    Returns:
+        str: Contenu de la newsletter
+        
+    Raises:
+        UnicodeDecodeError: Si le fichier n'est pas encodé en UTF-8
+    """
+    with open(path, 'rb') as f:
+        # mmap refuse les fichiers vides
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return str(mm, 'utf-8')
 
 def parse_date(date_str):
     """
@@ -293,10 +396,7 @@ def main():
         if args.url_newsletter:
             try:
                 print(f"Téléchargement de la newsletter depuis {args.url_newsletter}...")
-                text = download_newsletter(args.url_newsletter)
-                # Sauvegarder la newsletter téléchargée
-                with open(args.ariss_file, 'w', encoding='utf-8') as f:
-                    f.write(text)
+                download_newsletter(args.url_newsletter, args.ariss_file)
                 print(f"Newsletter sauvegardée dans {args.ariss_file}")
             except Exception as e:
                 print(f"Erreur: {str(e)}")
@@ -308,37 +408,32 @@ def main():
         
         # Lire le fichier
         try:
-            with open(args.ariss_file, 'r', encoding='utf-8') as file:
-                text = file.read()
+            text = read_newsletter(args.ariss_file)
         except Exception as e:
             print(f"Erreur lors de la lecture du fichier {args.ariss_file}: {str(e)}")
             sys.exit(1)
         
         # Générer les articles
-        generator = ArissArticleGenerator(text)
+        generator = ArissArticleGenerator(text, target_date.date() if target_date else None)
         
         contact_count = 0
+        separator = '=' * 80
+        output = []
         for contact in generator.contacts:
             if contact.date_time:  # Only process contacts with valid dates
-                # Si une date cible est spécifiée, vérifier si le contact est à cette date
-                if target_date:
-                    contact_date = datetime(
-                        contact.date_time.year,
-                        contact.date_time.month,
-                        contact.date_time.day
-                    )
-                    if contact_date.date() != target_date.date():
-                        continue
-                
                 contact_count += 1
                 article = generator.generate_wordpress_article(contact)
-                print(f"\n{'=' * 80}\n")
-                print(f"Title: {article['title']}")
-                print(f"Category: {article['category']}")
-                print(f"Status: {article['status']}\n")
-                print("Content:")
-                print(article['content'])
-                print(f"\n{'=' * 80}\n")
+                output.append(
+                    f"\n{separator}\n\n"
+                    f"Title: {article['title']}\n"
+                    f"Category: {article['category']}\n"
+                    f"Status: {article['status']}\n\n"
+                    "Content:\n"
+                    f"{article['content']}\n"
+                    f"\n{separator}\n\n"
+                )
+        # Une seule écriture pour l'ensemble des articles
+        sys.stdout.write("".join(output))
         if target_date:
             print(f"Nombre de contacts traités pour le {args.date} : {contact_count}")
         else: